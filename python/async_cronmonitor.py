@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+CronMonitor Async Python Client
+
+An asyncio-native variant of the CronMonitor client, for async
+applications or jobs that ping many monitors concurrently.
+
+Requirements: pip install aiohttp
+
+Pings are sent as HEAD requests, falling back to GET as in cronmonitor.py.
+
+Usage:
+    from async_cronmonitor import AsyncCronMonitor
+    
+    monitor = AsyncCronMonitor("YOUR_TOKEN")
+    
+    # Option 1: Manual ping
+    await do_work()
+    await monitor.ping()
+    
+    # Option 2: Decorator
+    @monitor.wrap
+    async def my_job():
+        await do_work()
+    
+    # Option 3: Async context manager
+    async with monitor:
+        await do_work()
+    
+    # Many monitors: share one session (and its connection pool)
+    async with AsyncCronMonitor.create_session() as session:
+        monitors = [AsyncCronMonitor(t, session=session) for t in tokens]
+        await asyncio.gather(*(m.ping() for m in monitors))
+    
+    # ...or let ping_many() do the same
+    results = await AsyncCronMonitor.ping_many(tokens)
+"""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Any, Dict, Iterable, Optional
+
+import aiohttp
+
+from cronmonitor import CronMonitor
+
+
+class AsyncCronMonitor:
+    """
+    Async CronMonitor client built on aiohttp.
+    
+    Accepts the same retry and backoff options as CronMonitor.
+    
+    Supports three integration patterns:
+    1. Manual: await monitor.ping() after successful job
+    2. Decorator: @monitor.wrap decorates your coroutine function
+    3. Context manager: use with 'async with' statement
+    
+    Inside 'async with', pings reuse one session and its keep-alive
+    connections. Pass session= to share a session between monitors;
+    otherwise each ping outside the context uses a short-lived session.
+    """
+    
+    BASE_URL = CronMonitor.BASE_URL
+    PLACEHOLDER_TOKEN = CronMonitor.PLACEHOLDER_TOKEN
+    HEADERS = CronMonitor.HEADERS
+    UNRECOVERABLE_STATUSES = CronMonitor.UNRECOVERABLE_STATUSES
+    HEAD_UNSUPPORTED_STATUSES = CronMonitor.HEAD_UNSUPPORTED_STATUSES
+    TRANSIENT_STATUSES = CronMonitor.TRANSIENT_STATUSES
+    
+    # Shared with the sync client; they only read the attributes set below
+    _log = CronMonitor._log
+    _retry_delay = CronMonitor._retry_delay
+    _head_rejected = CronMonitor._head_rejected
+    _record_get_fallback = CronMonitor._record_get_fallback
+    
+    def __init__(
+        self,
+        token: str,
+        timeout: int = 10,
+        retries: int = 3,
+        verbose: bool = False,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize AsyncCronMonitor client.
+        
+        Args:
+            token: Your CronMonitor ping token
+            timeout: Request timeout in seconds
+            retries: Number of retry attempts
+            verbose: Whether to print status messages
+            base_delay: Initial backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            jitter: Whether to randomize backoff delays (full jitter)
+            session: Session to send pings with; not closed by this monitor
+        """
+        self.token = token
+        self.timeout = timeout
+        self.retries = retries
+        self.verbose = verbose
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._ping_url = f"{self.BASE_URL}/ping/{token}"
+        self._method = "HEAD"
+        self._skip_get_fallback = False
+        self._session = session
+        self._owns_session = False
+        
+        # An unset or example token can never succeed; skip the network
+        self._disabled = not token or token == self.PLACEHOLDER_TOKEN
+    
+    @classmethod
+    def create_session(cls, timeout: int = 10) -> aiohttp.ClientSession:
+        """
+        Create a session with a keep-alive connection pool for pinging.
+        
+        Must be called from a running event loop. The caller is
+        responsible for closing it.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, keepalive_timeout=30, ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers=cls.HEADERS
+        )
+    
+    async def _request(self, session: aiohttp.ClientSession, method: str) -> int:
+        """
+        Send a single ping request.
+        
+        Returns:
+            HTTP status code of the response
+        """
+        async with session.request(
+            method,
+            self._ping_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            # Drain the body so the connection can be reused
+            await response.read()
+            return response.status
+    
+    async def _ping(self, session: aiohttp.ClientSession) -> int:
+        """
+        Send a ping, retrying a rejected HEAD with GET.
+        
+        Returns:
+            HTTP status code of the response
+        """
+        status = await self._request(session, self._method)
+        if self._method == "HEAD" and self._head_rejected(status):
+            get_status = await self._request(session, "GET")
+            self._record_get_fallback(status, get_status)
+            status = get_status
+        return status
+    
+    async def ping(self) -> bool:
+        """
+        Send success ping to CronMonitor.
+        
+        Returns:
+            True if ping was successful, False otherwise
+        """
+        if self._disabled:
+            self._log("Token not configured; skipping ping")
+            return False
+        
+        if self._session is None:
+            async with self.create_session(self.timeout) as session:
+                return await self._ping_with_retries(session)
+        return await self._ping_with_retries(self._session)
+    
+    async def _ping_with_retries(self, session: aiohttp.ClientSession) -> bool:
+        """Ping with retries and backoff over the given session"""
+        verbose = self.verbose
+        
+        for attempt in range(1, self.retries + 1):
+            try:
+                if verbose:
+                    self._log(f"Ping attempt {attempt}/{self.retries}")
+                
+                status = await self._ping(session)
+                
+                if status == 200:
+                    self._log("Ping sent successfully")
+                    return True
+                
+                if verbose:
+                    self._log(f"Attempt {attempt} failed: HTTP {status}")
+                
+                if status in self.UNRECOVERABLE_STATUSES:
+                    self._log("Unrecoverable error, not retrying")
+                    return False
+            
+            except Exception as e:
+                if verbose:
+                    self._log(f"Attempt {attempt} failed: {e}")
+            
+            # Wait before retry (exponential backoff with full jitter)
+            if attempt < self.retries:
+                sleep_time = self._retry_delay(attempt)
+                if verbose:
+                    self._log(f"Waiting {sleep_time:.2f}s before retry...")
+                await asyncio.sleep(sleep_time)
+        
+        self._log("All ping attempts failed")
+        return False
+    
+    @classmethod
+    async def ping_many(
+        cls,
+        tokens: Iterable[str],
+        **options: Any
+    ) -> Dict[str, bool]:
+        """
+        Ping several monitors concurrently over one shared session.
+        
+        Args:
+            tokens: Ping tokens of the monitors to ping
+            **options: AsyncCronMonitor options applied to every monitor
+        
+        Returns:
+            Mapping of token to whether its ping was successful
+        
+        Usage:
+            results = await AsyncCronMonitor.ping_many(["TOKEN_A", "TOKEN_B"])
+        """
+        tokens = list(dict.fromkeys(tokens))
+        if not tokens:
+            return {}
+        
+        async with cls.create_session(options.get("timeout", 10)) as session:
+            monitors = [
+                cls(token, session=session, **options) for token in tokens
+            ]
+            results = await asyncio.gather(*(m.ping() for m in monitors))
+        
+        return dict(zip(tokens, results))
+    
+    def wrap(
+        self, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """
+        Decorator that pings CronMonitor after successful execution.
+        
+        Usage:
+            @monitor.wrap
+            async def my_job():
+                await do_something()
+        """
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            self._log(f"Starting wrapped function: {func.__name__}")
+            
+            # Run the actual coroutine
+            result = await func(*args, **kwargs)
+            
+            # Ping on success
+            self._log(f"Function {func.__name__} completed, sending ping...")
+            await self.ping()
+            
+            return result
+        
+        return wrapper
+    
+    async def __aenter__(self) -> "AsyncCronMonitor":
+        """Async context manager entry. Opens a session unless one was given."""
+        self._log("Entering CronMonitor context")
+        if self._session is None:
+            self._session = self.create_session(self.timeout)
+            self._owns_session = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """
+        Async context manager exit.
+        Pings CronMonitor only if no exception occurred, then closes
+        the session opened by __aenter__.
+        """
+        try:
+            if exc_type is None:
+                self._log("Context completed successfully, sending ping...")
+                await self.ping()
+            else:
+                self._log(f"Context exited with exception: {exc_type.__name__}")
+        finally:
+            if self._owns_session:
+                await self._session.close()
+                self._session = None
+                self._owns_session = False
+        
+        # Don't suppress exceptions
+        return False
+
+
+# =============================================================================
+# EXAMPLE USAGE
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+    
+    async def main() -> int:
+        monitor = AsyncCronMonitor("YOUR_TOKEN", verbose=True)
+        
+        @monitor.wrap
+        async def my_async_job():
+            print("Running async job...")
+            await asyncio.sleep(0.5)
+            print("Async job done!")
+            return "result"
+        
+        try:
+            result = await my_async_job()
+            print(f"Got result: {result}")
+            return 0
+        except Exception as e:
+            print(f"Failed: {e}")
+            return 1
+    
+    sys.exit(asyncio.run(main()))
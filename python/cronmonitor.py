@@ -25,14 +25,219 @@ Usage:
     # Option 3: Context manager
     with monitor:
         do_work()
+    
+    # Don't block the job on the network round-trip: wrap() and the
+    # context manager ping from a background thread, flushed at exit
+    monitor = CronMonitor("YOUR_TOKEN", async_ping=True)
+
+Pings are sent as HEAD requests, so no response body is transferred. The
+server should accept HEAD on /ping/{token}; if HEAD is answered with a 4xx
+(other than 408/429, which are retried with backoff) or 501, the ping is
+retried with GET, and GET is used from then on when it succeeds.
 """
 
-import urllib.request
+import atexit
+import base64
+import concurrent.futures
+import http.client
+import os
+import queue
 import urllib.error
+import urllib.parse
+import urllib.request
 import functools
+import random
+import socket
+import threading
 import time
-from typing import Callable, Any, Optional
-from datetime import datetime
+import weakref
+from typing import Callable, Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _ResolvedHTTPSConnection(http.client.HTTPSConnection):
+    """
+    HTTPS connection to pre-resolved addresses, skipping the DNS lookup.
+    
+    TLS still uses the original host name for SNI and certificate checks.
+    """
+    
+    def __init__(self, host: str, port: int, addresses: List[Tuple], **kwargs):
+        super().__init__(host, port, **kwargs)
+        self._addresses = addresses
+        self._create_connection = self._connect_resolved
+    
+    def _connect_resolved(self, address, timeout, source_address=None):
+        """Connect to the first reachable pre-resolved address"""
+        error: Optional[OSError] = None
+        for sockaddr in self._addresses:
+            try:
+                return socket.create_connection(
+                    sockaddr[:2], timeout, source_address
+                )
+            except OSError as e:
+                error = e
+        raise error or OSError(f"No addresses for {address[0]}")
+
+
+class _ThreadConnection:
+    """
+    One thread's pooled connection.
+    
+    Only the thread's local storage holds it strongly, so the connection
+    is closed as soon as the thread exits. A copy inherited by a forked
+    child never closes the socket, which still belongs to the parent.
+    """
+    
+    __slots__ = ("conn", "generation", "pid", "__weakref__")
+    
+    def __init__(self, conn: http.client.HTTPSConnection, generation: int):
+        self.conn = conn
+        self.generation = generation
+        self.pid = os.getpid()
+    
+    def close(self) -> None:
+        if self.pid == os.getpid():
+            self.conn.close()
+    
+    def __del__(self) -> None:
+        self.close()
+
+
+class _ConnectionPool:
+    """
+    Keep-alive HTTPS connections to one host, one per thread.
+    
+    The host is resolved on first connect and cached for dns_ttl seconds.
+    When an https_proxy applies, connections tunnel through it instead.
+    """
+    
+    def __init__(self, host: str, port: int, timeout: float, dns_ttl: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.dns_ttl = dns_ttl
+        self._addresses: List[Tuple] = []
+        self._resolved_at = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._resolve_lock = threading.Lock()
+        # Weak, so connections of finished threads are not kept open
+        self._holders: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        # Bumped by close() so threads drop connections closed under them
+        self._generation = 0
+        self._pid = os.getpid()
+    
+    def _reset_after_fork(self) -> None:
+        """
+        Drop connections inherited from the parent process.
+        
+        Writing on the parent's TLS socket would corrupt both streams, so
+        the child starts over; the inherited holders won't close it.
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._resolve_lock = threading.Lock()
+        self._holders = weakref.WeakSet()
+        self._pid = os.getpid()
+    
+    def get(self) -> http.client.HTTPSConnection:
+        """Return this thread's connection, creating it if needed"""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        
+        holder = getattr(self._local, "holder", None)
+        if holder is None or holder.generation != self._generation:
+            holder = _ThreadConnection(self._connect(), self._generation)
+            with self._lock:
+                self._holders.add(holder)
+            self._local.holder = holder
+        return holder.conn
+    
+    def discard(self, forget_addresses: bool = False) -> None:
+        """Close this thread's connection, e.g. after an error"""
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            self._local.holder = None
+            holder.close()
+        if forget_addresses:
+            self._addresses = []
+    
+    def close(self) -> None:
+        """Close the connections of all threads"""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+            return
+        
+        with self._lock:
+            holders = list(self._holders)
+            self._generation += 1
+        for holder in holders:
+            holder.close()
+    
+    def _resolve(self) -> None:
+        """Look up and cache the addresses of the host"""
+        infos = socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        )
+        self._addresses = [info[4] for info in infos]
+        self._resolved_at = time.monotonic()
+    
+    def _connect(self) -> http.client.HTTPSConnection:
+        """Create a new (not yet connected) HTTPS connection"""
+        # The proxy resolves the target host itself
+        conn = self._proxy_connection()
+        if conn is not None:
+            return conn
+        
+        # Threads connecting at the same time share one lookup
+        with self._resolve_lock:
+            if (
+                not self._addresses
+                or time.monotonic() - self._resolved_at > self.dns_ttl
+            ):
+                try:
+                    self._resolve()
+                except OSError:
+                    self._addresses = []
+            addresses = self._addresses
+        
+        if addresses:
+            return _ResolvedHTTPSConnection(
+                self.host, self.port, addresses, timeout=self.timeout
+            )
+        return http.client.HTTPSConnection(
+            self.host, self.port, timeout=self.timeout
+        )
+    
+    def _proxy_connection(self) -> Optional[http.client.HTTPSConnection]:
+        """
+        Connection tunnelling through the https_proxy, if one applies.
+        
+        Honors https_proxy / no_proxy like urllib.request.urlopen() does.
+        """
+        proxy_url = urllib.request.getproxies().get("https")
+        if not proxy_url or urllib.request.proxy_bypass(self.host):
+            return None
+        
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        proxy = urllib.parse.urlsplit(proxy_url)
+        default_port = 443 if proxy.scheme == "https" else 80
+        
+        headers = {}
+        if proxy.username:
+            credentials = "{}:{}".format(
+                urllib.parse.unquote(proxy.username),
+                urllib.parse.unquote(proxy.password or "")
+            )
+            token = base64.b64encode(credentials.encode()).decode("ascii")
+            headers["Proxy-Authorization"] = f"Basic {token}"
+        
+        conn = http.client.HTTPSConnection(
+            proxy.hostname, proxy.port or default_port, timeout=self.timeout
+        )
+        conn.set_tunnel(self.host, self.port, headers=headers)
+        return conn
 
 
 class CronMonitor:
@@ -46,13 +251,43 @@ class CronMonitor:
     """
     
     BASE_URL = "https://cronmonitor.app"
+    PLACEHOLDER_TOKEN = "YOUR_TOKEN"
+    HEADERS = {"User-Agent": "CronMonitor-Python/1.0"}
+    
+    # Client errors that will not succeed on retry
+    UNRECOVERABLE_STATUSES = frozenset({400, 401, 403, 404})
+    
+    # Statuses meaning the server does not accept HEAD; ping with GET instead
+    HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+    
+    # Transient client errors: retried with backoff, never probed with GET
+    TRANSIENT_STATUSES = frozenset({408, 429})
+    
+    # Redirects are followed, as urllib.request.urlopen() does
+    REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+    
+    # Seconds to reuse resolved addresses before looking them up again
+    DNS_TTL = 300
+    
+    # Seconds to wait at interpreter exit for queued background pings
+    EXIT_FLUSH_TIMEOUT = 5.0
+    
+    # Background worker shared by all monitors (and subclasses) using
+    # async_ping; always accessed through CronMonitor, never cls
+    _queue: "queue.Queue[Callable[[], Any]]" = queue.Queue()
+    _worker: Optional[threading.Thread] = None
+    _worker_lock = threading.Lock()
     
     def __init__(
         self,
         token: str,
         timeout: int = 10,
         retries: int = 3,
-        verbose: bool = False
+        verbose: bool = False,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        async_ping: bool = False
     ):
         """
         Initialize CronMonitor client.
@@ -62,19 +297,212 @@ class CronMonitor:
             timeout: Request timeout in seconds
             retries: Number of retry attempts
             verbose: Whether to print status messages
+            base_delay: Initial backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            jitter: Whether to randomize backoff delays (full jitter)
+            async_ping: Whether wrap() and the context manager send the
+                ping from a background thread instead of blocking
         """
         self.token = token
         self.timeout = timeout
         self.retries = retries
         self.verbose = verbose
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.async_ping = async_ping
         self._ping_url = f"{self.BASE_URL}/ping/{token}"
+        
+        # Parse the URL once; the connection is reused across pings (keep-alive)
+        parsed = urllib.parse.urlsplit(self._ping_url)
+        self._host = parsed.hostname
+        self._port = parsed.port or 443
+        self._ping_path = parsed.path
+        self._pool = _ConnectionPool(
+            self._host, self._port, timeout, self.DNS_TTL
+        )
+        self._method = "HEAD"
+        # Set once GET failed exactly like HEAD (e.g. bad token)
+        self._skip_get_fallback = False
+        
+        # An unset or example token can never succeed; skip the network
+        self._disabled = not token or token == self.PLACEHOLDER_TOKEN
+        
+        if async_ping:
+            self._start_worker()
+    
+    @staticmethod
+    def _start_worker() -> None:
+        """Start the shared background ping thread if not running yet"""
+        with CronMonitor._worker_lock:
+            worker = CronMonitor._worker
+            if worker is None or not worker.is_alive():
+                worker = threading.Thread(
+                    target=CronMonitor._run_worker,
+                    args=(CronMonitor._queue,),
+                    name="CronMonitor-ping",
+                    daemon=True
+                )
+                worker.start()
+                CronMonitor._worker = worker
+    
+    @staticmethod
+    def _run_worker(jobs: "queue.Queue[Callable[[], Any]]") -> None:
+        """Run queued ping jobs forever"""
+        while True:
+            job = jobs.get()
+            try:
+                job()
+            except Exception:
+                pass
+            finally:
+                # Don't keep the last monitor alive while idle
+                job = None
+                jobs.task_done()
+    
+    @staticmethod
+    def _reset_worker() -> None:
+        """
+        Forget the parent's worker in a forked child.
+        
+        The thread does not survive fork(), and pings queued by the parent
+        are the parent's to send.
+        """
+        CronMonitor._queue = queue.Queue()
+        CronMonitor._worker = None
+        CronMonitor._worker_lock = threading.Lock()
+    
+    @staticmethod
+    def _wait_for_queue(timeout: float) -> bool:
+        """Wait until every queued background ping has finished"""
+        jobs = CronMonitor._queue
+        deadline = time.monotonic() + timeout
+        with jobs.all_tasks_done:
+            while jobs.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                jobs.all_tasks_done.wait(remaining)
+        return True
+    
+    def _request(self) -> int:
+        """
+        Send a single ping request over the persistent connection.
+        
+        Pings use HEAD so no response body is transferred. If the server
+        rejects HEAD, retry with GET and keep using GET if that works. If
+        the server closed the idle keep-alive connection, reconnect once.
+        
+        Returns:
+            HTTP status code of the response
+        """
+        status = self._send(self._method)
+        if self._method == "HEAD" and self._head_rejected(status):
+            get_status = self._send("GET")
+            self._record_get_fallback(status, get_status)
+            status = get_status
+        return status
+    
+    def _head_rejected(self, status: int) -> bool:
+        """
+        Whether a HEAD response may just mean the server only routes GET.
+        
+        A 4xx is retried with GET before it is treated as unrecoverable,
+        so a GET-only endpoint never causes a false "job missed" alert.
+        Rate limiting and timeouts are left to the normal backoff.
+        """
+        if status in self.HEAD_UNSUPPORTED_STATUSES:
+            return True
+        return (
+            400 <= status < 500
+            and status not in self.TRANSIENT_STATUSES
+            and not self._skip_get_fallback
+        )
+    
+    def _record_get_fallback(self, head_status: int, get_status: int) -> None:
+        """Decide which method later pings use after a GET fallback"""
+        # Keep GET if it worked, or if the server refused HEAD outright
+        if get_status == 200 or head_status in self.HEAD_UNSUPPORTED_STATUSES:
+            self._method = "GET"
+        # GET failed the same way (e.g. bad token): don't probe it again
+        elif get_status == head_status:
+            self._skip_get_fallback = True
+    
+    def _send(self, method: str) -> int:
+        """Send one request over this thread's pooled connection"""
+        for reconnect in (False, True):
+            conn = self._pool.get()
+            # An idle keep-alive socket may have been dropped by the server
+            reused = conn.sock is not None
+            try:
+                conn.request(method, self._ping_path, headers=self.HEADERS)
+                response = conn.getresponse()
+                # Drain the body so the connection can be reused
+                response.read()
+                
+                location = response.getheader("Location")
+                if response.status in self.REDIRECT_STATUSES and location:
+                    return self._follow_redirect(method, location)
+                return response.status
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine):
+                self._pool.discard()
+                if reconnect:
+                    raise
+            except (ConnectionResetError, BrokenPipeError):
+                # Stale connection; the request never reached the server
+                self._pool.discard()
+                if reconnect or not reused:
+                    raise
+            except Exception as e:
+                # The host may have moved; resolve again next time
+                self._pool.discard(forget_addresses=isinstance(e, OSError))
+                raise
+    
+    def _follow_redirect(self, method: str, location: str) -> int:
+        """
+        Follow a redirect with urllib, which handles further hops.
+        
+        Redirects are not expected in normal operation, so this one-off
+        request does not use the persistent connection.
+        
+        Returns:
+            HTTP status code of the final response
+        """
+        request = urllib.request.Request(
+            urllib.parse.urljoin(self._ping_url, location),
+            method=method,
+            headers=self.HEADERS
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+    
+    def close(self) -> None:
+        """Close the persistent connections"""
+        self._pool.close()
+    
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def _log(self, message: str) -> None:
         """Print message if verbose mode is enabled"""
         if self.verbose:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             print(f"[{timestamp}] [CronMonitor] {message}")
     
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay in seconds to wait after the given failed attempt"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+    
     def ping(self) -> bool:
         """
         Send success ping to CronMonitor.
@@ -82,35 +510,121 @@ class CronMonitor:
         Returns:
             True if ping was successful, False otherwise
         """
+        if self._disabled:
+            self._log("Token not configured; skipping ping")
+            return False
+        
+        verbose = self.verbose
+        
         for attempt in range(1, self.retries + 1):
             try:
-                self._log(f"Ping attempt {attempt}/{self.retries}")
-                
-                request = urllib.request.Request(
-                    self._ping_url,
-                    headers={"User-Agent": "CronMonitor-Python/1.0"}
-                )
+                if verbose:
+                    self._log(f"Ping attempt {attempt}/{self.retries}")
                 
-                response = urllib.request.urlopen(request, timeout=self.timeout)
+                status = self._request()
                 
-                if response.status == 200:
+                if status == 200:
                     self._log("Ping sent successfully")
                     return True
+                
+                if verbose:
+                    self._log(f"Attempt {attempt} failed: HTTP {status}")
+                
+                if status in self.UNRECOVERABLE_STATUSES:
+                    self._log("Unrecoverable error, not retrying")
+                    return False
                     
-            except urllib.error.URLError as e:
-                self._log(f"Attempt {attempt} failed: {e}")
             except Exception as e:
-                self._log(f"Attempt {attempt} failed: {e}")
+                if verbose:
+                    self._log(f"Attempt {attempt} failed: {e}")
             
-            # Wait before retry (exponential backoff)
+            # Wait before retry (exponential backoff with full jitter)
             if attempt < self.retries:
-                sleep_time = 0.5 * attempt
-                self._log(f"Waiting {sleep_time}s before retry...")
+                sleep_time = self._retry_delay(attempt)
+                if verbose:
+                    self._log(f"Waiting {sleep_time:.2f}s before retry...")
                 time.sleep(sleep_time)
         
         self._log("All ping attempts failed")
         return False
     
+    @classmethod
+    def ping_many(
+        cls,
+        tokens: Iterable[str],
+        max_workers: int = 32,
+        **options: Any
+    ) -> Dict[str, bool]:
+        """
+        Ping several monitors concurrently.
+        
+        Pings run in a thread pool so total time is close to the slowest
+        single ping. All tokens share one set of keep-alive connections,
+        one per worker thread, and the host is resolved once.
+        
+        Args:
+            tokens: Ping tokens of the monitors to ping
+            max_workers: Maximum number of pings in flight at once
+            **options: CronMonitor options applied to every monitor
+        
+        Returns:
+            Mapping of token to whether its ping was successful
+        
+        Usage:
+            results = CronMonitor.ping_many(["TOKEN_A", "TOKEN_B"])
+        """
+        tokens = list(dict.fromkeys(tokens))
+        if not tokens:
+            return {}
+        
+        monitors = [cls(token, **options) for token in tokens]
+        pool = monitors[0]._pool
+        for monitor in monitors[1:]:
+            monitor._pool = pool
+        
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(tokens))
+            ) as executor:
+                results = executor.map(lambda m: m.ping(), monitors)
+                return dict(zip(tokens, results))
+        finally:
+            pool.close()
+    
+    def ping_async(self) -> None:
+        """
+        Queue a ping to be sent from the background thread.
+        
+        Returns immediately; use flush() to wait for queued pings.
+        """
+        self._start_worker()
+        CronMonitor._queue.put(self.ping)
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for queued background pings to finish.
+        
+        Waits for pings from all monitors, since they share one queue.
+        Queued pings are also flushed automatically at interpreter exit.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if all queued pings finished, False on timeout
+        """
+        if not self._wait_for_queue(timeout):
+            self._log("Timed out waiting for queued pings")
+            return False
+        return True
+    
+    def _send_ping(self) -> None:
+        """Ping in the background if async_ping is set, otherwise block"""
+        if self.async_ping:
+            self.ping_async()
+        else:
+            self.ping()
+    
     def wrap(self, func: Callable) -> Callable:
         """
         Decorator that pings CronMonitor after successful execution.
@@ -120,16 +634,21 @@ class CronMonitor:
             def my_job():
                 do_something()
         """
+        name = func.__name__
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            self._log(f"Starting wrapped function: {func.__name__}")
+            # Build log messages only when they will be printed
+            if self.verbose:
+                self._log(f"Starting wrapped function: {name}")
             
             # Run the actual function
             result = func(*args, **kwargs)
             
             # Ping on success
-            self._log(f"Function {func.__name__} completed, sending ping...")
-            self.ping()
+            if self.verbose:
+                self._log(f"Function {name} completed, sending ping...")
+            self._send_ping()
             
             return result
         
@@ -147,7 +666,7 @@ class CronMonitor:
         """
         if exc_type is None:
             self._log("Context completed successfully, sending ping...")
-            self.ping()
+            self._send_ping()
         else:
             self._log(f"Context exited with exception: {exc_type.__name__}")
         
@@ -155,14 +674,33 @@ class CronMonitor:
         return False
 
 
+def _flush_at_exit() -> None:
+    """Give queued background pings one overall deadline to finish"""
+    CronMonitor._wait_for_queue(CronMonitor.EXIT_FLUSH_TIMEOUT)
+
+
+atexit.register(_flush_at_exit)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=CronMonitor._reset_worker)
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# Monitors reused by ping() so repeated calls share one connection
+_MONITOR_CACHE: Dict[Tuple[str, int], CronMonitor] = {}
+_MONITOR_CACHE_LOCK = threading.Lock()
+
+
 def ping(token: str, timeout: int = 10) -> bool:
     """
     Quick ping function for simple use cases.
     
+    Monitors are cached per (token, timeout), so calling ping() in a loop
+    reuses the same keep-alive connection.
+    
     Usage:
         from cronmonitor import ping
         
@@ -172,7 +710,25 @@ def ping(token: str, timeout: int = 10) -> bool:
         except Exception:
             exit(1)
     """
-    return CronMonitor(token, timeout=timeout).ping()
+    key = (token, timeout)
+    monitor = _MONITOR_CACHE.get(key)
+    if monitor is None:
+        with _MONITOR_CACHE_LOCK:
+            monitor = _MONITOR_CACHE.get(key)
+            if monitor is None:
+                monitor = _MONITOR_CACHE[key] = CronMonitor(token, timeout=timeout)
+    return monitor.ping()
+
+
+def _close_cached_monitors() -> None:
+    """Close connections held by monitors created via ping()"""
+    with _MONITOR_CACHE_LOCK:
+        for monitor in _MONITOR_CACHE.values():
+            monitor.close()
+        _MONITOR_CACHE.clear()
+
+
+atexit.register(_close_cached_monitors)
 
 
 def cronmonitor(token: str, timeout: int = 10) -> Callable:
@@ -12,7 +12,7 @@ No external dependencies required - uses standard library only.
 import urllib.request
 import urllib.error
 import sys
-from datetime import datetime
+import time
 
 # =============================================================================
 # CONFIGURATION
@@ -21,13 +21,17 @@ from datetime import datetime
 PING_URL = "https://cronmonitor.app/ping/YOUR_TOKEN"
 TIMEOUT = 10  # seconds
 
+# Built once at import, reused for every ping
+_OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler())
+_PING_REQUEST = urllib.request.Request(PING_URL)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 def log(message: str) -> None:
     """Print timestamped log message"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] {message}")
 
 
@@ -36,9 +40,16 @@ def ping_cronmonitor() -> bool:
     Send success ping to CronMonitor.
     Returns True if successful, False otherwise.
     """
+    # Token is whatever follows /ping/ (empty for ".../ping/")
+    token = PING_URL.rstrip("/").rpartition("/ping")[2].lstrip("/")
+    if not token or token == "YOUR_TOKEN":
+        log("Warning: PING_URL token not configured; skipping ping")
+        return False
+    
     try:
         log("Sending ping to CronMonitor...")
-        urllib.request.urlopen(PING_URL, timeout=TIMEOUT)
+        with _OPENER.open(_PING_REQUEST, timeout=TIMEOUT):
+            pass
         log("Ping sent successfully!")
         return True
     except urllib.error.URLError as e:
@@ -73,7 +84,6 @@ def run_job() -> None:
     # data = response.read()
     
     # Simulated work (remove this in production)
-    import time
     time.sleep(1)
     
     log("Job completed successfully!")